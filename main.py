@@ -1,42 +1,58 @@
+import os
+import argparse
 import logging
-from src.utils import create_output_directory, load_config, save_data
-from src.processors.process_platforms import process_platforms
+from src.blob_store import BlobStore
+from src.planner import plan_research
+from src.utils import LOG_FORMAT, create_file_log_handler, create_output_directory, load_config
+from src.processors.process_platforms import run_research
+from src.service import serve
+from src.task_queue import TaskQueue
 
-output_dir = create_output_directory('runs')
-
-log_filename = f"{output_dir}/app.log"
 logger = logging.getLogger()
 logger.setLevel(logging.DEBUG)  
 
 stream_handler = logging.StreamHandler()
 stream_handler.setLevel(logging.INFO)
-stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-
-file_handler = logging.FileHandler(log_filename)
-file_handler.setLevel(logging.DEBUG)
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 
 logger.addHandler(stream_handler)
-logger.addHandler(file_handler)
 
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Summarize, organize and filter information from web platforms.")
+    parser.add_argument('--config', default='./config/config.yaml', help="Path to the research config file.")
+    parser.add_argument('--plan', action='store_true', help="Only fetch sources and estimate LLM calls, tokens and time.")
+    parser.add_argument('--serve', action='store_true', help="Run as a service accepting research jobs over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1', help="Service host (with --serve).")
+    parser.add_argument('--port', type=int, default=8765, help="Service port (with --serve).")
+    parser.add_argument('--task-queue', default=None, help="SQLite task queue path; tagging is done by worker.py processes.")
+    parser.add_argument('--task-timeout', type=float, default=None,
+                        help="Seconds without finished tagging tasks before giving up (with --task-queue).")
+    return parser.parse_args()
+
+
 def main():
-    config = load_config('./config/config.yaml')
+    args = parse_args()
+    task_queue = TaskQueue(args.task_queue, batch_timeout=args.task_timeout) if args.task_queue else None
+    if args.serve:
+        serve(args.host, args.port, base_dir='runs', task_queue=task_queue)
+        return
+
+    output_dir = create_output_directory('runs')
+    logger.addHandler(create_file_log_handler(output_dir))
+
+    config = load_config(args.config)
     logger.debug("Configuration loaded.")
-    search_phrases = config['search_queries']
-    platforms = [platform.lower() for platform in config['platforms']]
-    max_outputs = config['max_outputs_per_platform']
-    time_horizon = config['time_horizon']
-    specific_questions = config['specific_questions']
 
-    results, rest_results, run_name = process_platforms(
-        platforms, search_phrases, specific_questions, time_horizon, max_outputs
-    )
+    if args.plan:
+        plan_research(config, output_dir, base_dir='runs', blob_store=BlobStore(os.path.join(output_dir, 'blobs')))
+        logger.info("Plan saved to: %s", output_dir)
+        return
 
-    save_data(output_dir, run_name, results, rest_results, config)
+    run_research(config, output_dir, task_queue=task_queue)
 
     logger.info("Data saved to: %s", output_dir)
 
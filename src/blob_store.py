@@ -0,0 +1,78 @@
+import os
+import hashlib
+import logging
+import yaml
+
+logger = logging.getLogger(__name__)
+
+BLOB_EXTENSION = ".txt"
+
+
+class ContentRef:
+    __slots__ = ("store", "key", "length")
+
+    def __init__(self, store, key, length):
+        self.store = store
+        self.key = key
+        self.length = length
+
+    def load(self):
+        return self.store.get(self.key)
+
+    @property
+    def path(self):
+        return self.store.path(self.key)
+
+    def __bool__(self):
+        return self.length > 0
+
+    def __len__(self):
+        return self.length
+
+    def __eq__(self, other):
+        return isinstance(other, ContentRef) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"ContentRef({self.path!r}, length={self.length})"
+
+
+class BlobStore:
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        os.makedirs(root_dir, exist_ok=True)
+        logger.debug("Blob store initialized in: %s", root_dir)
+
+    def path(self, key):
+        return os.path.join(self.root_dir, key + BLOB_EXTENSION)
+
+    def put(self, text):
+        encoded = text.encode("utf-8")
+        key = hashlib.sha256(encoded).hexdigest()
+        path = self.path(key)
+        if not os.path.exists(path):
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(encoded)
+            os.replace(tmp_path, path)
+            logger.debug("Blob stored: %s (%d bytes)", key, len(encoded))
+        return ContentRef(self, key, len(text))
+
+    def get(self, key):
+        with open(self.path(key), "r", encoding="utf-8") as file:
+            return file.read()
+
+
+def load_content(content):
+    if isinstance(content, ContentRef):
+        return content.load()
+    return content
+
+
+def _represent_content_ref(dumper, content_ref):
+    return dumper.represent_str(content_ref.path)
+
+
+yaml.add_representer(ContentRef, _represent_content_ref)
@@ -1,20 +1,93 @@
 import yaml
 import re
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
 
+COLLECTED = "collected"
+WITH_CONTENT = "with_content"
+NO_CONTENT = "no_content"
+TAGGED = "tagged"
+RELEVANT = "relevant"
+NOT_RELEVANT = "not_relevant"
+TOP = "top"
+LESS_RELEVANT = "less_relevant"
+
+
+def make_record_id(platform_name, title, url=None):
+    key = f"{platform_name}\n{url or title}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+class DataRecord:
+    __slots__ = ("id", "platform", "title", "tags", "status")
+
+    def __init__(self, record_id, platform, title, tags, status=COLLECTED):
+        self.id = record_id
+        self.platform = platform
+        self.title = title
+        self.tags = tags
+        self.status = status
+
+    def __repr__(self):
+        return f"DataRecord({self.id!r}, {self.platform!r}, {self.title!r}, status={self.status!r})"
+
+
 class DataStorage:
-    def __init__(self):
-        self.data = {}
+    def __init__(self, blob_store=None):
+        self.records = {}
+        self.platform_index = {}
+        self.blob_store = blob_store
+
+    def __len__(self):
+        return len(self.records)
 
     def add_data(self, platform_name, title, **tags):
-        self.data.setdefault(platform_name, {})[title] = tags
+        content = tags.get("content")
+        if self.blob_store is not None and isinstance(content, str) and content:
+            tags["content"] = self.blob_store.put(content)
+        record_id = make_record_id(platform_name, title, tags.get("url"))
+        self.add_record(DataRecord(record_id, platform_name, title, tags))
         logger.debug("Data added for platform: %s, title: %s", platform_name, title)
-    
+
+    def add_record(self, record):
+        self.records[record.id] = record
+        self.platform_index.setdefault(record.platform, {})[record.id] = None
+
+    def records_for(self, platform_name=None, status=None):
+        if platform_name is not None:
+            record_ids = self.platform_index.get(platform_name, {})
+        else:
+            record_ids = self.records
+        records = [self.records[record_id] for record_id in record_ids]
+        if status is not None:
+            records = [record for record in records if record.status == status]
+        return records
+
+    def partition(self, predicate, status_true, status_false):
+        matching = DataStorage(blob_store=self.blob_store)
+        rest = DataStorage(blob_store=self.blob_store)
+        for record in list(self.records.values()):
+            if predicate(record):
+                record.status = status_true
+                matching.add_record(record)
+            else:
+                record.status = status_false
+                rest.add_record(record)
+        return matching, rest
+
+    def sort(self, key, reverse=False):
+        sorted_records = sorted(self.records.values(), key=key, reverse=reverse)
+        self.records = {record.id: record for record in sorted_records}
+        for platform_name, record_ids in self.platform_index.items():
+            self.platform_index[platform_name] = {
+                record.id: None for record in sorted_records if record.id in record_ids
+            }
+
     def combine(self, data_storage):
-        for platform_name, titles in data_storage.data.items():
-            self.data.setdefault(platform_name, {}).update(titles)
+        for record in data_storage.records.values():
+            self.add_record(record)
 
     def add_data_list(self, platform_name, data_list):
         for item_details in data_list:
@@ -22,6 +95,22 @@ class DataStorage:
             self.add_data(platform_name, title, **item_details)
         logger.debug("Data list added for platform: %s", platform_name)
 
+    def titled_data(self, title_key=None):
+        data = {}
+        for platform_name, record_ids in self.platform_index.items():
+            titles = data.setdefault(platform_name, {})
+            for record_id in record_ids:
+                record = self.records[record_id]
+                title = title_key(record.title) if title_key else record.title
+                if title in titles:
+                    title = f"{title} {record.id}"
+                titles[title] = record.tags
+        return data
+
+    @property
+    def data(self):
+        return self.titled_data()
+
     def to_dict(self):
         return self.data
 
@@ -30,9 +119,7 @@ class DataStorage:
         return clean_title
 
     def save_to_yaml(self, filename):
-        cleaned_data = {}
-        for platform_name, titles in self.data.items():
-            cleaned_data[platform_name] = {self.clean_title(title): tags for title, tags in titles.items()}
+        cleaned_data = self.titled_data(title_key=self.clean_title)
         with open(filename, "w") as file:
             yaml.dump(cleaned_data, file, default_flow_style=False, sort_keys=False)
         logger.debug("Data saved to YAML file: %s", filename)
@@ -1,5 +1,6 @@
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,6 +11,7 @@ CHUNK_OVERLAP = 150
 class BaseLLM:
     def __init__(self, model_name: str):
         self.model_name = model_name
+        self.stats = {}
         logger.debug("BaseLLM initialized with model: %s", model_name)
 
     def split_text_to_chunks(self, text: str, chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP) -> List[str]:
@@ -24,6 +26,15 @@ class BaseLLM:
     def generate_response(self, prompt: str) -> str:
         raise NotImplementedError("Subclasses should implement this method.")
 
+    def timed_response(self, stage: str, prompt: str) -> str:
+        started = time.perf_counter()
+        response = self.generate_response(prompt)
+        stage_stats = self.stats.setdefault(stage, {"calls": 0, "seconds": 0.0, "prompt_tokens": 0})
+        stage_stats["calls"] += 1
+        stage_stats["seconds"] += time.perf_counter() - started
+        stage_stats["prompt_tokens"] += len(self.tokenize(prompt))
+        return response
+
     def summarize(self, content: str, chunk_size=CHUNK_SIZE, questions=[]) -> Tuple[str, bool]:
         if not content:
             return "Content not available.", False
@@ -36,7 +47,7 @@ class BaseLLM:
         
         for chunk in chunks:
             prompt = prompt_base + chunk
-            summary = self.generate_response(prompt)
+            summary = self.timed_response("summarize", prompt)
             summaries.append(summary)
 
         combined_summary = "\n".join(summaries)
@@ -54,27 +65,46 @@ class BaseLLM:
                   "Each paragraph should be separated by a newline and focus on a single key point. Don't add any comments, just the summary. "
                   "Remove redundant information. Make it as detailed as possible. The output shouldn't be much smaller than the input. "
                   f"You are not a summarizer, just an organizer.\nSummaries: {combined_text}")
-        return self.generate_response(prompt)
+        return self.timed_response("organize", prompt)
 
     def ask_llama_question(self, question: str, details: str, detailed_summary: str) -> str:
         text = details if len(self.tokenize(details)) <= CHUNK_SIZE else detailed_summary
         prompt = f"Based on the text, answer the question: {question}\n\ntext:\n{text}"
-        return self.generate_response(prompt)
+        return self.timed_response("question", prompt)
 
     def validate_with_q_and_a_relevance(self, question: str, answer: str) -> bool:
         prompt = (f"Given the answer: \"{answer}\", does it provide a precise and specific response to the question: \"{question}\" without introducing unrelated details, "
                   "general tips, or inferred information not explicitly stated in the text? Please provide a 'yes' or 'no' response.")
-        response = self.generate_response(prompt)
+        response = self.timed_response("validation", prompt)
         return 'yes' in response.lower()
 
     def validate_with_llm_knowledge(self, question: str, answer: str) -> bool:
         prompt = (f"Given the answer: \"{answer}\" for the question: \"{question}\", based on your knowledge, is this answer truthful? Please provide a 'yes' or 'no' response.")
-        response = self.generate_response(prompt)
+        response = self.timed_response("validation", prompt)
         return not 'no' in response.lower()
 
+    def tag_content(self, content: str, questions: List[str]) -> Dict:
+        tags = {}
+        summary, combine_flag = self.summarize(content=content, questions=questions)
+
+        if combine_flag:
+            tags["detailed_summary"] = summary
+            tags["summary"] = self.organize_summarization_into_one(summary)
+        else:
+            tags["summary"] = summary
+
+        relevance_score = 0
+        for question in questions:
+            answer = self.ask_llama_question(question, content, summary)
+            if self.validate_with_q_and_a_relevance(question, answer) and self.validate_with_llm_knowledge(question, answer):
+                tags.setdefault("Q&A", {})[question] = answer
+                relevance_score += 1
+        tags["relevance_score"] = relevance_score
+        return tags
+
     def provide_run_name(self, queries: List[str], questions: List[str]) -> str:
         prompt = (f"Create a short name (up to 24 characters) based on the following queries and questions, provide only the answer without any additional text:\n\n"
                   f"Queries:\n{', '.join(queries)}\n\nQuestions:\n{', '.join(questions)}\n"
                   "Aim is to provide a short name to as precisely as possible describe the search, which makes the best sense.")
-        response = self.generate_response(prompt)
+        response = self.timed_response("run_name", prompt)
         return response.replace(" ", "_")
@@ -3,8 +3,8 @@ from src.llm.ollama_llm import OllamaLLM
 
 class LLMFactory:
     @staticmethod
-    def create_llm(model_type: str, model_name: str = "llama3:instruct"):
+    def create_llm(model_type: str, model_name: str = "llama3:instruct", host: str = None):
         if model_type == "ollama":
-            return OllamaLLM(model_name=model_name)
+            return OllamaLLM(model_name=model_name, host=host)
         else:
             raise ValueError(f"Unsupported model type: {model_type}")
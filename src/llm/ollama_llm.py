@@ -3,9 +3,10 @@ from src.llm.base_llm import BaseLLM
 
 
 class OllamaLLM(BaseLLM):
-    def __init__(self, model_name="llama3:instruct"):
+    def __init__(self, model_name="llama3:instruct", host=None):
         super().__init__(model_name)
+        self.client = ollama.Client(host=host)
 
     def generate_response(self, prompt: str) -> str:
-        response = ollama.generate(model=self.model_name, prompt=prompt)
+        response = self.client.generate(model=self.model_name, prompt=prompt)
         return response.get('response', "").strip()
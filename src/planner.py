@@ -0,0 +1,133 @@
+import os
+import glob
+import time
+import logging
+import yaml
+from src.blob_store import load_content
+from src.utils import STATS_FILENAME
+from src.llm.base_llm import CHUNK_SIZE
+from src.processors.process_platforms import get_processor
+
+logger = logging.getLogger(__name__)
+
+PLAN_FILENAME = "plan.yaml"
+LLM_STAGES = ["summarize", "organize", "question", "validation", "run_name"]
+
+
+def load_llm_throughput(base_dir):
+    totals = {}
+    for path in glob.glob(os.path.join(base_dir, "**", STATS_FILENAME), recursive=True):
+        with open(path, "r") as file:
+            stats = yaml.safe_load(file) or {}
+        for stage, stage_stats in stats.items():
+            total = totals.setdefault(stage, {"calls": 0, "seconds": 0.0, "prompt_tokens": 0})
+            for key in total:
+                total[key] += stage_stats.get(key, 0)
+    return {
+        stage: {
+            "seconds_per_call": total["seconds"] / total["calls"],
+            "prompt_tokens_per_call": total["prompt_tokens"] / total["calls"],
+        }
+        for stage, total in totals.items() if total["calls"]
+    }
+
+
+def estimate_item_calls(llm, content, questions):
+    chunks = llm.split_text_to_chunks(content)
+    content_tokens = len(llm.tokenize(content))
+    question_tokens = min(content_tokens, CHUNK_SIZE)
+    return {
+        "summarize": {"calls": len(chunks), "prompt_tokens": sum(len(llm.tokenize(chunk)) for chunk in chunks)},
+        "organize": {"calls": 1 if len(chunks) > 1 else 0, "prompt_tokens": None},
+        "question": {"calls": len(questions), "prompt_tokens": question_tokens * len(questions)},
+        "validation": {"calls": 2 * len(questions), "prompt_tokens": None},
+    }
+
+
+def plan_platform(processor, queries, questions, time_horizon, blob_store=None):
+    started = time.perf_counter()
+    combined_data = processor.combine_multiple_queries(queries, time_horizon, blob_store)
+    data_with_content, data_without_content = processor.check_source_content(combined_data)
+    fetch_seconds = time.perf_counter() - started
+
+    stages = {stage: {"calls": 0, "prompt_tokens": 0} for stage in LLM_STAGES if stage != "run_name"}
+    for record in data_with_content.records_for(platform_name=processor.platform_name):
+        item_calls = estimate_item_calls(processor.llm, load_content(record.tags["content"]), questions)
+        for stage, estimate in item_calls.items():
+            stages[stage]["calls"] += estimate["calls"]
+            if estimate["prompt_tokens"] is None or stages[stage]["prompt_tokens"] is None:
+                stages[stage]["prompt_tokens"] = None
+            else:
+                stages[stage]["prompt_tokens"] += estimate["prompt_tokens"]
+
+    return {
+        "items_with_content": len(data_with_content),
+        "items_without_content": len(data_without_content),
+        "fetch_seconds": round(fetch_seconds, 1),
+        "stages": stages,
+    }
+
+
+def add_projected_time(stages, throughput):
+    projected_seconds = 0.0
+    for stage, estimate in stages.items():
+        stage_throughput = throughput.get(stage)
+        if stage_throughput is None:
+            estimate["projected_seconds"] = None
+            continue
+        if estimate["prompt_tokens"] is None:
+            estimate["prompt_tokens"] = round(estimate["calls"] * stage_throughput["prompt_tokens_per_call"])
+        estimate["projected_seconds"] = round(estimate["calls"] * stage_throughput["seconds_per_call"], 1)
+        projected_seconds += estimate["projected_seconds"]
+    return projected_seconds
+
+
+def plan_research(config, output_dir, base_dir='runs', processors=None, blob_store=None):
+    platforms = [platform.lower() for platform in config['platforms']]
+    questions = config['specific_questions']
+    throughput = load_llm_throughput(base_dir)
+    if not throughput:
+        logger.warning("No LLM throughput recorded in %s yet; time is projected only for the fetch stage", base_dir)
+
+    plan = {"platforms": {}, "total": {"llm_calls": 0, "projected_seconds": 0.0}}
+    for platform in platforms:
+        try:
+            processor = get_processor(platform, processors, config)
+        except ValueError as e:
+            logger.error("Error planning platform %s: %s", platform, str(e))
+            continue
+        platform_plan = plan_platform(processor, config['search_queries'], questions, config['time_horizon'], blob_store)
+        llm_seconds = add_projected_time(platform_plan["stages"], throughput)
+        platform_plan["projected_seconds"] = round(platform_plan["fetch_seconds"] + llm_seconds, 1)
+        plan["platforms"][platform] = platform_plan
+        plan["total"]["llm_calls"] += sum(stage["calls"] for stage in platform_plan["stages"].values())
+        plan["total"]["projected_seconds"] += platform_plan["projected_seconds"]
+
+    run_name_stage = {"run_name": {"calls": 1, "prompt_tokens": None}}
+    plan["total"]["llm_calls"] += 1
+    plan["total"]["projected_seconds"] = round(
+        plan["total"]["projected_seconds"] + add_projected_time(run_name_stage, throughput), 1
+    )
+    plan["total"]["seconds_per_call_used"] = {
+        stage: round(stage_throughput["seconds_per_call"], 2) for stage, stage_throughput in throughput.items()
+    }
+
+    with open(os.path.join(output_dir, PLAN_FILENAME), "w") as file:
+        yaml.dump(plan, file, default_flow_style=False, sort_keys=False)
+    log_plan(plan)
+    return plan
+
+
+def log_plan(plan):
+    for platform, platform_plan in plan["platforms"].items():
+        logger.info("Plan for %s: %d items with content, %d without, fetch took %.1fs",
+                    platform, platform_plan["items_with_content"], platform_plan["items_without_content"],
+                    platform_plan["fetch_seconds"])
+        for stage, estimate in platform_plan["stages"].items():
+            projected = estimate["projected_seconds"]
+            prompt_tokens = estimate["prompt_tokens"]
+            logger.info("  %-10s %6d calls %9s prompt tokens  %s", stage, estimate["calls"],
+                        "n/a" if prompt_tokens is None else prompt_tokens,
+                        "n/a" if projected is None else f"{projected / 60:.1f} min")
+    logger.info("Plan total: %d LLM calls (validation is an upper bound), projected %.1f min",
+                plan["total"]["llm_calls"], plan["total"]["projected_seconds"] / 60)
@@ -2,7 +2,10 @@ from abc import ABC, abstractmethod
 from typing import List
 import logging
 from tqdm import tqdm
-from src.data_storage import DataStorage
+from src.data_storage import (
+    DataStorage, WITH_CONTENT, NO_CONTENT, TAGGED, RELEVANT, NOT_RELEVANT, TOP, LESS_RELEVANT
+)
+from src.blob_store import load_content
 from src.llm.llm_factory import LLMFactory
 
 logger = logging.getLogger(__name__)
@@ -17,18 +20,22 @@ class BaseProcessor(ABC):
         self.llm = LLMFactory.create_llm(model_type=MODEL_PLATFORM, model_name=MODEL_NAME)
         logger.debug("BaseProcessor initialized for platform: %s", platform_name)
 
-    def process(self, queries: List[str], questions: List[str], time_horizon, max_outputs_per_platform=7) -> DataStorage:
-        combined_data = self.combine_multiple_queries(queries, time_horizon)
+    def configure(self, config):
+        pass
+
+    def process(self, queries: List[str], questions: List[str], time_horizon, max_outputs_per_platform=7, blob_store=None,
+                task_queue=None) -> DataStorage:
+        combined_data = self.combine_multiple_queries(queries, time_horizon, blob_store)
         data_with_content, data_without_content = self.check_source_content(combined_data)
-        tagged_data = self.add_smart_tags(data_with_content, questions)
+        tagged_data = self.add_smart_tags(data_with_content, questions, task_queue)
         relevant_data, not_relevant_data = self.filter_relevant_sources(tagged_data)
         ranked_data = self.rank_sources_by_relevance(relevant_data)
         top_data, less_relevant_data = self.choose_top_sources(ranked_data, max_outputs_per_platform)
         logger.info("Processing completed for platform: %s", self.platform_name)
         return top_data, data_without_content, less_relevant_data, not_relevant_data
 
-    def combine_multiple_queries(self, queries: List[str], time_horizon) -> DataStorage:
-        combined_storage = DataStorage()
+    def combine_multiple_queries(self, queries: List[str], time_horizon, blob_store=None) -> DataStorage:
+        combined_storage = DataStorage(blob_store=blob_store)
         for query in queries:
             query_list = self.process_query(query, time_horizon)
             combined_storage.add_data_list(self.platform_name, query_list)
@@ -38,78 +45,56 @@ class BaseProcessor(ABC):
     def process_query(self, query: str, time_horizon) -> DataStorage:
         pass
 
-    def add_smart_tags(self, data_storage: DataStorage, questions: List[str]) -> DataStorage:
-        titles = data_storage.data[self.platform_name].keys()
-        for title in tqdm(titles, desc=f"Processing items for {self.platform_name}"):
-            content = data_storage.data[self.platform_name][title].get("content")
-            if not content:
-                continue
-
-            logger.debug(f"Processing data item entitled: '{title}'")
-            summary, combine_flag = self.llm.summarize(content=content, questions=questions)
-
-            if combine_flag:
-                combined_summary = self.llm.organize_summarization_into_one(summary)
-                data_storage.data[self.platform_name][title].pop("content")
-                data_storage.data[self.platform_name][title]["detailed_summary"] = summary
-                data_storage.data[self.platform_name][title]["summary"] = combined_summary
+    def add_smart_tags(self, data_storage: DataStorage, questions: List[str], task_queue=None) -> DataStorage:
+        records = [record for record in data_storage.records_for(platform_name=self.platform_name)
+                   if record.tags.get("content")]
+        if task_queue is not None:
+            return self.add_smart_tags_with_queue(data_storage, records, questions, task_queue)
+
+        for record in tqdm(records, desc=f"Processing items for {self.platform_name}"):
+            logger.debug(f"Processing data item entitled: '{record.title}'")
+            tags = self.llm.tag_content(load_content(record.tags["content"]), questions)
+            self.apply_smart_tags(record, tags)
+        return data_storage
+
+    def add_smart_tags_with_queue(self, data_storage: DataStorage, records, questions: List[str], task_queue) -> DataStorage:
+        batch_id = task_queue.enqueue_batch(
+            (record.id, {"content": load_content(record.tags["content"]), "questions": questions}) for record in records
+        )
+        logger.info("Queued %d tagging tasks for platform: %s (batch: %s)", len(records), self.platform_name, batch_id)
+        results, errors = task_queue.wait_for_batch(batch_id, desc=f"Processing items for {self.platform_name}")
+        for record in records:
+            if record.id in results:
+                self.apply_smart_tags(record, results[record.id])
             else:
-                data_storage.data[self.platform_name][title]["summary"] = summary
-
-            relevance_score = 0
-            for question in questions:
-                answer = self.llm.ask_llama_question(question, content, summary)
-                if self.llm.validate_with_q_and_a_relevance(question, answer) and self.llm.validate_with_llm_knowledge(question, answer):
-                    if "Q&A" not in data_storage.data[self.platform_name][title]:
-                        data_storage.data[self.platform_name][title]["Q&A"] = {}
-                    data_storage.data[self.platform_name][title]["Q&A"][question] = answer
-                    relevance_score += 1
-            data_storage.data[self.platform_name][title]["relevance_score"] = relevance_score
+                logger.error("Tagging failed for item '%s': %s", record.title, errors.get(record.id))
         return data_storage
 
+    def apply_smart_tags(self, record, tags):
+        if "detailed_summary" in tags:
+            record.tags.pop("content", None)
+        record.tags.update(tags)
+        record.status = TAGGED
+
     def filter_relevant_sources(self, data_storage: DataStorage) -> DataStorage:
-        relevant_data = DataStorage()
-        not_relevant_data = DataStorage()
-        for platform_name, titles in data_storage.data.items():
-            for title, info in titles.items():
-                if info.get("relevance_score", 0) > 0:
-                    relevant_data.add_data(platform_name, title, **titles[title])
-                else:
-                    not_relevant_data.add_data(platform_name, title, **titles[title])
-        return relevant_data, not_relevant_data
+        return data_storage.partition(
+            lambda record: record.tags.get("relevance_score", 0) > 0, RELEVANT, NOT_RELEVANT
+        )
 
     def rank_sources_by_relevance(self, data_storage: DataStorage) -> DataStorage:
-        sorted_data = {}
-        for platform_name, titles in data_storage.data.items():
-            sorted_titles = dict(sorted(titles.items(), key=lambda item: item[1].get("relevance_score", 0), reverse=True))
-            for title in sorted_titles:
-                sorted_titles[title].pop("relevance_score", None)
-            sorted_data[platform_name] = sorted_titles
-        data_storage.data = sorted_data
+        data_storage.sort(key=lambda record: record.tags.get("relevance_score", 0), reverse=True)
+        for record in data_storage.records.values():
+            record.tags.pop("relevance_score", None)
         return data_storage
     
     def choose_top_sources(self, data_storage: DataStorage, max_outputs_per_platform: int):
-        top_data = DataStorage()
-        less_relevant_data = DataStorage()
-        for platform_name, titles in data_storage.data.items():
-            for title in titles.keys():
-                if len(top_data.data.get(platform_name, {})) < max_outputs_per_platform:
-                    top_data.add_data(platform_name, title, **titles[title])
-                else:
-                    less_relevant_data.add_data(platform_name, title, **titles[title])
-        return top_data, less_relevant_data
+        top_ids = set()
+        for record_ids in data_storage.platform_index.values():
+            top_ids.update(list(record_ids)[:max_outputs_per_platform])
+        return data_storage.partition(lambda record: record.id in top_ids, TOP, LESS_RELEVANT)
 
     def check_source_content(self, data_storage: DataStorage):
-        data_with_content = DataStorage()
-        data_without_content = DataStorage()
-        for platform_name, titles in data_storage.data.items():
-            for title, details in titles.items():
-                content = details.get("content")
-                if content:
-                    data_with_content.add_data(platform_name, title, **titles[title])
-                else:
-                    data_without_content.add_data(platform_name, title, **titles[title])
-        return data_with_content, data_without_content
+        return data_storage.partition(lambda record: bool(record.tags.get("content")), WITH_CONTENT, NO_CONTENT)
 
 
 class InDepthProcessor(BaseProcessor):
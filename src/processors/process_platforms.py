@@ -1,19 +1,26 @@
+import os
 import logging
+from src.blob_store import BlobStore
+from src.utils import save_data, save_llm_stats
 from src.processors.processor_factory import ProcessorFactory
 
 logger = logging.getLogger(__name__)
 
-def process_platforms(platforms, queries, specific_questions, time_horizon, max_outputs):
+def process_platforms(platforms, queries, specific_questions, time_horizon, max_outputs, blob_store=None,
+                      processors=None, on_progress=None, task_queue=None, config=None):
     logger.info(f"Processing platforms: {platforms}")
     for index, platform in enumerate(platforms):
         try:
-            processor = ProcessorFactory.create_processor(platform)
-            logger.debug("Processor created for platform: %s", platform)
+            if on_progress:
+                on_progress(platform, index, len(platforms))
+            processor = get_processor(platform, processors, config)
             top_results, results_without_content, less_relevant_results, rejected_results = processor.process(
                 queries, 
                 questions=specific_questions, 
                 time_horizon=time_horizon, 
-                max_outputs_per_platform=max_outputs
+                max_outputs_per_platform=max_outputs,
+                blob_store=blob_store,
+                task_queue=task_queue
             )
             if index > 0:
                 combined_results.combine(top_results)
@@ -36,5 +43,43 @@ def process_platforms(platforms, queries, specific_questions, time_horizon, max_
         'rejected_by_relevance': combined_rejected_results.data
     }
 
+    if on_progress:
+        on_progress(None, len(platforms), len(platforms))
     logger.debug("Platform processing completed")
     return combined_results, rest_results, run_name
+
+
+def get_processor(platform, processors=None, config=None):
+    if processors is not None and platform in processors:
+        logger.debug("Reusing processor for platform: %s", platform)
+        processor = processors[platform]
+    else:
+        processor = ProcessorFactory.create_processor(platform)
+        logger.debug("Processor created for platform: %s", platform)
+        if processors is not None:
+            processors[platform] = processor
+    processor.configure(config or {})
+    return processor
+
+
+def run_research(config, output_dir, processors=None, on_progress=None, task_queue=None):
+    platforms = [platform.lower() for platform in config['platforms']]
+    blob_store = BlobStore(os.path.join(output_dir, 'blobs'))
+    processors = {} if processors is None else processors
+
+    results, rest_results, run_name = process_platforms(
+        platforms,
+        config['search_queries'],
+        config['specific_questions'],
+        config['time_horizon'],
+        config['max_outputs_per_platform'],
+        blob_store,
+        processors=processors,
+        on_progress=on_progress,
+        task_queue=task_queue,
+        config=config
+    )
+
+    save_data(output_dir, run_name, results, rest_results, config)
+    save_llm_stats(output_dir, processors)
+    return run_name
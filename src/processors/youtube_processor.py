@@ -1,22 +1,38 @@
 import os
+import time
+import logging
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import (
+    YouTubeTranscriptApi, NoTranscriptFound, TranscriptsDisabled, VideoUnavailable, InvalidVideoId
+)
 from google.auth.transport.requests import Request
 from src.processors.base_processor import InDepthProcessor
 
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_MISSING_ERRORS = (NoTranscriptFound, TranscriptsDisabled, VideoUnavailable, InvalidVideoId)
 
 class YouTubeProcessor(InDepthProcessor):
     SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
     TOKEN_PATH = "./credentials/token.json"
     CREDENTIALS_FILE = "./credentials/credentials.json"
     QUALITY_THRESHOLD = 0.2
+    TRANSCRIPT_LANGUAGES = ["en"]
+    TRANSCRIPT_WORKERS = 8
+    TRANSCRIPT_RETRIES = 3
+    TRANSCRIPT_RETRY_DELAY = 2
 
     def __init__(self, platform_name="youtube"):
         super().__init__(platform_name)
         self.youtube = self.authenticate_youtube()
+        self.transcript_languages = list(self.TRANSCRIPT_LANGUAGES)
+
+    def configure(self, config):
+        self.transcript_languages = config.get('transcript_languages') or list(self.TRANSCRIPT_LANGUAGES)
 
     def authenticate_youtube(self):
         creds = None
@@ -59,14 +75,38 @@ class YouTubeProcessor(InDepthProcessor):
         return days_since_creation
     
     def collect_source_details(self, sources):
+        video_ids = [video_id for _, _, _, video_id in sources]
+        with ThreadPoolExecutor(max_workers=self.TRANSCRIPT_WORKERS) as executor:
+            transcripts = list(executor.map(self.fetch_transcript, video_ids))
+
         data = []
-        for _, title, url, video_id in sources:
-            item_details = {'title': title, 
-                            'url':url, 
-                            'content':self.fetch_detailed_content(video_id)}
+        for (_, title, url, _), (transcript_text, missing_content) in zip(sources, transcripts):
+            item_details = {'title': title, 'url': url}
+            if missing_content:
+                item_details['missing_content'] = missing_content
+            else:
+                item_details['content'] = transcript_text
             data.append(item_details)
         return data
 
+    def fetch_transcript(self, video_id):
+        for attempt in range(1, self.TRANSCRIPT_RETRIES + 1):
+            try:
+                transcript_text = self.fetch_detailed_content(video_id)
+                break
+            except TRANSCRIPT_MISSING_ERRORS as e:
+                logger.debug("Transcript not available for video %s: %s", video_id, e)
+                return None, {'reason': type(e).__name__, 'error': str(e)}
+            except Exception as e:
+                if attempt == self.TRANSCRIPT_RETRIES:
+                    logger.warning("Transcript fetch failed for video %s after %d attempts: %s", video_id, attempt, e)
+                    return None, {'reason': type(e).__name__, 'error': str(e)}
+                logger.debug("Transcript fetch failed for video %s (attempt %d): %s", video_id, attempt, e)
+                time.sleep(self.TRANSCRIPT_RETRY_DELAY * attempt)
+        if not transcript_text.strip():
+            return None, {'reason': 'EmptyTranscript'}
+        return transcript_text, None
+
     def get_video_details(self, video_id):
         response = self.youtube.videos().list(part="statistics,snippet", id=video_id).execute()["items"][0]
         channel_id = response["snippet"]["channelId"]
@@ -106,10 +146,10 @@ class YouTubeProcessor(InDepthProcessor):
         return quality
 
     def fetch_detailed_content(self, video_id):
+        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
         try:
-            transcript = YouTubeTranscriptApi.get_transcript(video_id)
-            transcript_text = " ".join([entry["text"] for entry in transcript])
-        except Exception:
-            transcript_text = "Transcript not available."
-        return transcript_text
+            transcript = transcript_list.find_manually_created_transcript(self.transcript_languages)
+        except NoTranscriptFound:
+            transcript = transcript_list.find_generated_transcript(self.transcript_languages)
+        return " ".join([entry["text"] for entry in transcript.fetch()])
 
@@ -0,0 +1,195 @@
+import json
+import uuid
+import queue
+import datetime
+import logging
+import threading
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.utils import create_file_log_handler, create_output_directory
+from src.processors.process_platforms import run_research
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_CONFIG_KEYS = [
+    'search_queries', 'specific_questions', 'platforms', 'time_horizon', 'max_outputs_per_platform'
+]
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def now():
+    return datetime.datetime.now().isoformat(timespec='seconds')
+
+
+def validate_config(config):
+    if not isinstance(config, dict):
+        raise ValueError("Job config must be a JSON object")
+    missing = [key for key in REQUIRED_CONFIG_KEYS if key not in config]
+    if missing:
+        raise ValueError(f"Job config is missing keys: {missing}")
+    if not config['platforms']:
+        raise ValueError("Job config must list at least one platform")
+
+
+class Job:
+    def __init__(self, config):
+        self.id = uuid.uuid4().hex[:12]
+        self.config = config
+        self.status = QUEUED
+        self.progress = {}
+        self.output_dir = None
+        self.run_name = None
+        self.error = None
+        self.submitted_at = now()
+        self.started_at = None
+        self.finished_at = None
+
+    def update_progress(self, platform, completed_platforms, total_platforms):
+        self.progress = {
+            'platform': platform,
+            'completed_platforms': completed_platforms,
+            'total_platforms': total_platforms,
+        }
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'status': self.status,
+            'progress': self.progress,
+            'output_dir': self.output_dir,
+            'run_name': self.run_name,
+            'error': self.error,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class ResearchService:
+    def __init__(self, base_dir='runs', task_queue=None):
+        self.base_dir = base_dir
+        self.task_queue = task_queue
+        self.jobs = {}
+        self.queue = queue.Queue()
+        self.processors = {}
+        self.lock = threading.Lock()
+        self.worker = threading.Thread(target=self.run_jobs, daemon=True)
+
+    def start(self):
+        self.worker.start()
+        logger.info("Research service worker started")
+
+    def submit(self, config):
+        validate_config(config)
+        job = Job(config)
+        with self.lock:
+            self.jobs[job.id] = job
+        self.queue.put(job)
+        logger.info("Job queued: %s", job.id)
+        return job
+
+    def get_job(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        with self.lock:
+            return list(self.jobs.values())
+
+    def run_jobs(self):
+        while True:
+            job = self.queue.get()
+            try:
+                self.run_job(job)
+            finally:
+                self.queue.task_done()
+
+    def run_job(self, job):
+        job.status = RUNNING
+        job.started_at = now()
+        logger.info("Job started: %s", job.id)
+        file_handler = None
+        try:
+            job.output_dir = create_output_directory(f"{self.base_dir}/{job.id}")
+            file_handler = create_file_log_handler(job.output_dir)
+            logging.getLogger().addHandler(file_handler)
+            job.run_name = run_research(
+                job.config, job.output_dir, processors=self.processors, on_progress=job.update_progress,
+                task_queue=self.task_queue
+            )
+            job.status = DONE
+            logger.info("Job finished: %s, data saved to: %s", job.id, job.output_dir)
+        except Exception as e:
+            job.status = FAILED
+            job.error = str(e)
+            logger.error("Job %s failed: %s\n%s", job.id, e, traceback.format_exc())
+        finally:
+            job.finished_at = now()
+            for processor in self.processors.values():
+                processor.llm.stats = {}
+            if file_handler is not None:
+                logging.getLogger().removeHandler(file_handler)
+                file_handler.close()
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    service = None
+
+    def send_json(self, status_code, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parts = [part for part in self.path.split('?')[0].split('/') if part]
+        if parts == ['health']:
+            self.send_json(200, {'status': 'ok', 'queued_jobs': self.service.queue.qsize()})
+        elif parts == ['jobs']:
+            self.send_json(200, [job.to_dict() for job in self.service.list_jobs()])
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            job = self.service.get_job(parts[1])
+            if job is None:
+                self.send_json(404, {'error': f"Unknown job: {parts[1]}"})
+            else:
+                self.send_json(200, job.to_dict())
+        else:
+            self.send_json(404, {'error': f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/jobs':
+            self.send_json(404, {'error': f"Unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            if length < 0:
+                raise ValueError(f"Invalid Content-Length: {length}")
+            config = json.loads(self.rfile.read(length) or b'null')
+            job = self.service.submit(config)
+        except ValueError as e:
+            self.send_json(400, {'error': str(e)})
+            return
+        self.send_json(202, job.to_dict())
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def serve(host, port, base_dir='runs', task_queue=None):
+    service = ResearchService(base_dir, task_queue)
+    service.start()
+    handler = type('BoundServiceRequestHandler', (ServiceRequestHandler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    logger.info("Research service listening on http://%s:%d", host, port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Research service stopped")
+    finally:
+        server.server_close()
@@ -0,0 +1,199 @@
+import json
+import time
+import uuid
+import sqlite3
+import logging
+from tqdm import tqdm
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+MAX_ATTEMPTS = 3
+LEASE_SECONDS = 3 * 60 * 60
+POLL_INTERVAL = 5
+UNCLAIMED_WARNING_POLLS = 3
+
+
+class TaskQueue:
+    def __init__(self, path, lease_seconds=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS, batch_timeout=None):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.batch_timeout = batch_timeout
+        with self.connect() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    batch_id TEXT NOT NULL,
+                    task_key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    worker TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    claimed_at REAL,
+                    UNIQUE (batch_id, task_key)
+                )
+            """)
+            connection.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, claimed_at)")
+        logger.debug("Task queue opened: %s", path)
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        connection.execute("PRAGMA busy_timeout = 60000")
+        return _Transaction(connection)
+
+    def enqueue_batch(self, tasks):
+        batch_id = uuid.uuid4().hex
+        with self.connect() as connection:
+            for task_key, payload in tasks:
+                connection.execute(
+                    "INSERT INTO tasks (batch_id, task_key, payload, status) VALUES (?, ?, ?, ?)",
+                    (batch_id, task_key, json.dumps(payload), PENDING)
+                )
+        return batch_id
+
+    def fail_expired(self, connection):
+        connection.execute(
+            "UPDATE tasks SET status = ?, error = ? WHERE status = ? AND claimed_at < ? AND attempts >= ?",
+            (FAILED, f"Lease expired after {self.max_attempts} attempts", RUNNING,
+             time.time() - self.lease_seconds, self.max_attempts)
+        )
+
+    def claim(self, worker):
+        expired_before = time.time() - self.lease_seconds
+        with self.connect() as connection:
+            self.fail_expired(connection)
+            row = connection.execute(
+                "SELECT id, payload FROM tasks WHERE status = ? OR (status = ? AND claimed_at < ? AND attempts < ?) "
+                "ORDER BY id LIMIT 1",
+                (PENDING, RUNNING, expired_before, self.max_attempts)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE tasks SET status = ?, worker = ?, claimed_at = ?, attempts = attempts + 1 WHERE id = ?",
+                (RUNNING, worker, time.time(), row[0])
+            )
+        return row[0], json.loads(row[1])
+
+    def complete(self, task_id, worker, result):
+        with self.connect() as connection:
+            cursor = connection.execute(
+                "UPDATE tasks SET status = ?, result = ?, payload = '{}' WHERE id = ? AND worker = ? AND status = ?",
+                (DONE, json.dumps(result), task_id, worker, RUNNING)
+            )
+        return cursor.rowcount > 0
+
+    def fail(self, task_id, worker, error):
+        with self.connect() as connection:
+            cursor = connection.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts < ? THEN ? ELSE ? END, error = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (self.max_attempts, PENDING, FAILED, error, task_id, worker, RUNNING)
+            )
+        return cursor.rowcount > 0
+
+    def batch_counts(self, batch_id):
+        with self.connect() as connection:
+            self.fail_expired(connection)
+            rows = connection.execute(
+                "SELECT status, COUNT(*) FROM tasks WHERE batch_id = ? GROUP BY status", (batch_id,)
+            ).fetchall()
+        return dict(rows)
+
+    def batch_claimed(self, batch_id):
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT COUNT(*) FROM tasks WHERE batch_id = ? AND attempts > 0", (batch_id,)
+            ).fetchone()
+        return row[0] > 0
+
+    def wait_for_batch(self, batch_id, poll_interval=POLL_INTERVAL, desc=None, timeout=None):
+        if timeout is None:
+            timeout = self.batch_timeout
+        if timeout is None:
+            timeout = self.lease_seconds * self.max_attempts
+        counts = self.batch_counts(batch_id)
+        total = sum(counts.values())
+        last_progress_at = time.time()
+        polls = 0
+        claimed = False
+        with tqdm(total=total, desc=desc) as progress:
+            while True:
+                polls += 1
+                if not claimed and polls >= UNCLAIMED_WARNING_POLLS:
+                    claimed = self.batch_claimed(batch_id)
+                    if not claimed and polls == UNCLAIMED_WARNING_POLLS:
+                        logger.warning("No worker has claimed a task from batch %s yet; is worker.py running against %s?",
+                                       batch_id, self.path)
+                finished = counts.get(DONE, 0) + counts.get(FAILED, 0)
+                if finished > progress.n:
+                    progress.update(finished - progress.n)
+                    last_progress_at = time.time()
+                if finished >= total:
+                    break
+                if time.time() - last_progress_at >= timeout:
+                    logger.error("No progress on batch %s for %d seconds, %d of %d tasks unfinished",
+                                 batch_id, timeout, total - finished, total)
+                    break
+                time.sleep(poll_interval)
+                counts = self.batch_counts(batch_id)
+
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT task_key, status, result, error FROM tasks WHERE batch_id = ?", (batch_id,)
+            ).fetchall()
+            connection.execute("DELETE FROM tasks WHERE batch_id = ?", (batch_id,))
+        results = {task_key: json.loads(result) for task_key, status, result, _ in rows if status == DONE}
+        errors = {task_key: error for task_key, status, _, error in rows if status == FAILED}
+        errors.update({task_key: "Timed out waiting for a worker" for task_key, status, _, _ in rows
+                       if status in (PENDING, RUNNING)})
+        return results, errors
+
+
+class _Transaction:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.connection.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.connection.close()
+
+
+def run_worker(task_queue, llm, worker, poll_interval=POLL_INTERVAL, stop_when_empty=False):
+    logger.info("Worker %s started with model: %s", worker, llm.model_name)
+    while True:
+        try:
+            task = task_queue.claim(worker)
+            if task is None:
+                if stop_when_empty:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            task_id, payload = task
+            logger.debug("Worker %s processing task: %s", worker, task_id)
+            try:
+                tags = llm.tag_content(payload["content"], payload["questions"])
+            except Exception as e:
+                logger.error("Task %s failed on worker %s: %s", task_id, worker, e)
+                if not task_queue.fail(task_id, worker, str(e)):
+                    logger.warning("Task %s is no longer owned by worker %s, failure discarded", task_id, worker)
+            else:
+                if not task_queue.complete(task_id, worker, tags):
+                    logger.warning("Task %s is no longer owned by worker %s, result discarded", task_id, worker)
+        except sqlite3.OperationalError as e:
+            logger.error("Task queue error on worker %s: %s", worker, e)
+            time.sleep(poll_interval)
@@ -5,6 +5,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+STATS_FILENAME = "llm_stats.yaml"
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
 def load_config(file_path):
     with open(file_path, 'r') as file:
         config = yaml.safe_load(file)
@@ -18,10 +21,30 @@ def create_output_directory(base_dir):
     logger.debug("Output directory created: %s", output_dir)
     return output_dir
 
+def create_file_log_handler(output_dir):
+    file_handler = logging.FileHandler(os.path.join(output_dir, "app.log"))
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    return file_handler
+
 def save_data(output_dir, name, results_data, rest_data, user_config):
     results_data.save_to_yaml(os.path.join(output_dir, f"{name}.yaml"))
     with open(os.path.join(output_dir, f"rest_of_the_data.yaml"), "w") as file:
         yaml.dump(rest_data, file, default_flow_style=False, sort_keys=False)
     with open(os.path.join(output_dir, f"run_config.yaml"), "w") as file:
         yaml.dump(user_config, file, default_flow_style=False, sort_keys=False)
-    logger.debug("Data saved to directory: %s", output_dir)
\ No newline at end of file
+    logger.debug("Data saved to directory: %s", output_dir)
+
+def save_llm_stats(output_dir, processors):
+    stats = {}
+    for processor in processors.values():
+        for stage, stage_stats in processor.llm.stats.items():
+            total = stats.setdefault(stage, {"calls": 0, "seconds": 0.0, "prompt_tokens": 0})
+            for key, value in stage_stats.items():
+                total[key] += value
+        processor.llm.stats = {}
+    if not stats:
+        return
+    with open(os.path.join(output_dir, STATS_FILENAME), "w") as file:
+        yaml.dump(stats, file, default_flow_style=False, sort_keys=False)
+    logger.debug("LLM stats saved to directory: %s", output_dir)
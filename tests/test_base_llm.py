@@ -49,3 +49,10 @@ def test_provide_run_name(mock_llm):
     run_name = mock_llm.provide_run_name(queries, questions)
     assert isinstance(run_name, str)
     assert len(run_name) <= 24
+
+def test_llm_calls_are_recorded_per_stage(mock_llm):
+    mock_llm.summarize("Some content to summarize.")
+    mock_llm.validate_with_q_and_a_relevance("Is this relevant?", "Yes, it is.")
+    assert mock_llm.stats["summarize"]["calls"] == 1
+    assert mock_llm.stats["validation"]["calls"] == 1
+    assert mock_llm.stats["summarize"]["prompt_tokens"] > 0
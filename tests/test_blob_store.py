@@ -0,0 +1,27 @@
+import pytest
+import yaml
+from src.blob_store import BlobStore, ContentRef, load_content
+
+@pytest.fixture
+def blob_store(tmp_path):
+    return BlobStore(tmp_path / "blobs")
+
+def test_put_and_load(blob_store):
+    content_ref = blob_store.put("Some long transcript")
+    assert isinstance(content_ref, ContentRef)
+    assert content_ref.load() == "Some long transcript"
+    assert len(content_ref) == len("Some long transcript")
+
+def test_put_is_content_addressed(blob_store):
+    first_ref = blob_store.put("Same content")
+    second_ref = blob_store.put("Same content")
+    assert first_ref == second_ref
+    assert len(list(blob_store.root_dir.iterdir())) == 1
+
+def test_load_content_passes_plain_text_through():
+    assert load_content("plain text") == "plain text"
+
+def test_content_ref_dumped_as_path(blob_store):
+    content_ref = blob_store.put("Dumped content")
+    dumped = yaml.safe_load(yaml.dump({"content": content_ref}))
+    assert dumped["content"] == content_ref.path
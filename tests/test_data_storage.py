@@ -1,6 +1,7 @@
 import pytest
 import yaml
-from src.data_storage import DataStorage
+from src.data_storage import DataStorage, WITH_CONTENT, NO_CONTENT, TAGGED
+from src.blob_store import BlobStore, ContentRef
 
 @pytest.fixture
 def data_storage():
@@ -51,3 +52,64 @@ def test_save_to_yaml(data_storage, tmp_path):
     assert "platform4" in loaded_data
     assert "title6" in loaded_data["platform4"]
     assert loaded_data["platform4"]["title6"]["tag6"] == "value6"
+
+def test_add_data_spills_content_to_blob_store(tmp_path):
+    blob_store = BlobStore(tmp_path / "blobs")
+    data_storage = DataStorage(blob_store=blob_store)
+    data_storage.add_data("platform5", "title7", content="Long content")
+    content = data_storage.data["platform5"]["title7"]["content"]
+    assert isinstance(content, ContentRef)
+    assert content.load() == "Long content"
+
+def test_same_title_different_sources_are_kept(data_storage):
+    data_storage.add_data("platform6", "title8", url="https://a.example")
+    data_storage.add_data("platform6", "title8", url="https://b.example")
+    assert len(data_storage) == 2
+    assert len(data_storage.data["platform6"]) == 2
+
+def test_partition_shares_records_and_updates_status(data_storage):
+    data_storage.add_data("platform7", "title9", content="text")
+    data_storage.add_data("platform7", "title10", content="")
+    with_content, without_content = data_storage.partition(
+        lambda record: bool(record.tags.get("content")), WITH_CONTENT, NO_CONTENT
+    )
+    assert [record.title for record in with_content.records_for("platform7")] == ["title9"]
+    assert [record.title for record in without_content.records_for(status=NO_CONTENT)] == ["title10"]
+    record = with_content.records_for("platform7")[0]
+    assert data_storage.records[record.id] is record
+    assert data_storage.records_for(status=WITH_CONTENT) == [record]
+
+def test_sort_reorders_platform_records(data_storage):
+    data_storage.add_data("platform8", "low", score=1)
+    data_storage.add_data("platform8", "high", score=3)
+    data_storage.sort(key=lambda record: record.tags["score"], reverse=True)
+    assert list(data_storage.data["platform8"]) == ["high", "low"]
+
+def test_root_store_tracks_status_after_later_stages(data_storage):
+    data_storage.add_data("platform9", "title11", content="text")
+    with_content, _ = data_storage.partition(
+        lambda record: bool(record.tags.get("content")), WITH_CONTENT, NO_CONTENT
+    )
+    record = with_content.records_for("platform9")[0]
+    record.status = TAGGED
+    assert data_storage.records_for(status=WITH_CONTENT) == []
+    assert data_storage.records_for(status=TAGGED) == [record]
+
+def test_save_to_yaml_keeps_titles_equal_after_cleaning(data_storage, tmp_path):
+    data_storage.add_data("platform10", "Same!", url="https://a.example")
+    data_storage.add_data("platform10", "Same?", url="https://b.example")
+    file_path = tmp_path / "test.yaml"
+    data_storage.save_to_yaml(file_path)
+    with open(file_path, "r") as file:
+        loaded_data = yaml.safe_load(file)
+    assert len(loaded_data["platform10"]) == 2
+    assert "Same" in loaded_data["platform10"]
+
+def test_duplicate_titles_renamed_the_same_way_in_data_and_yaml(data_storage, tmp_path):
+    data_storage.add_data("platform11", "Same", url="https://a.example")
+    data_storage.add_data("platform11", "Same", url="https://b.example")
+    file_path = tmp_path / "test.yaml"
+    data_storage.save_to_yaml(file_path)
+    with open(file_path, "r") as file:
+        loaded_data = yaml.safe_load(file)
+    assert list(loaded_data["platform11"]) == list(data_storage.data["platform11"])
@@ -0,0 +1,93 @@
+import os
+import pytest
+import yaml
+from src.data_storage import DataStorage, WITH_CONTENT, NO_CONTENT
+from src.planner import load_llm_throughput, estimate_item_calls, add_projected_time, plan_platform
+from src.utils import STATS_FILENAME
+
+class MockLLM:
+    def split_text_to_chunks(self, text, chunk_size=1000, chunk_overlap=0):
+        return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+    def tokenize(self, text):
+        return text.split()
+
+class MockProcessor:
+    platform_name = "platform1"
+
+    def __init__(self, items):
+        self.items = items
+        self.llm = MockLLM()
+
+    def combine_multiple_queries(self, queries, time_horizon, blob_store=None):
+        data_storage = DataStorage(blob_store=blob_store)
+        data_storage.add_data_list(self.platform_name, [dict(item) for item in self.items])
+        return data_storage
+
+    def check_source_content(self, data_storage):
+        return data_storage.partition(lambda record: bool(record.tags.get("content")), WITH_CONTENT, NO_CONTENT)
+
+def write_stats(run_dir, stats):
+    os.makedirs(run_dir, exist_ok=True)
+    with open(os.path.join(run_dir, STATS_FILENAME), "w") as file:
+        yaml.dump(stats, file)
+
+def test_estimate_item_calls_single_chunk():
+    item_calls = estimate_item_calls(MockLLM(), "short content", ["q1", "q2", "q3"])
+    assert item_calls["summarize"]["calls"] == 1
+    assert item_calls["organize"]["calls"] == 0
+    assert item_calls["question"]["calls"] == 3
+    assert item_calls["validation"]["calls"] == 6
+
+def test_estimate_item_calls_multi_chunk_counts_organize():
+    item_calls = estimate_item_calls(MockLLM(), "word " * 500, ["q1"])
+    assert item_calls["summarize"]["calls"] == 3
+    assert item_calls["summarize"]["prompt_tokens"] == 500
+    assert item_calls["organize"]["calls"] == 1
+    assert item_calls["organize"]["prompt_tokens"] is None
+    assert item_calls["validation"]["calls"] == 2
+
+def test_load_llm_throughput_averages_runs(tmp_path):
+    write_stats(tmp_path / "run1", {"summarize": {"calls": 2, "seconds": 10.0, "prompt_tokens": 200}})
+    write_stats(tmp_path / "job" / "run2", {"summarize": {"calls": 3, "seconds": 20.0, "prompt_tokens": 300}})
+    throughput = load_llm_throughput(str(tmp_path))
+    assert throughput["summarize"]["seconds_per_call"] == pytest.approx(6.0)
+    assert throughput["summarize"]["prompt_tokens_per_call"] == pytest.approx(100.0)
+
+def test_load_llm_throughput_without_history(tmp_path):
+    assert load_llm_throughput(str(tmp_path)) == {}
+
+def test_add_projected_time_without_throughput():
+    stages = {
+        "summarize": {"calls": 4, "prompt_tokens": 400},
+        "validation": {"calls": 6, "prompt_tokens": None},
+    }
+    throughput = {"summarize": {"seconds_per_call": 2.5, "prompt_tokens_per_call": 100.0}}
+    projected_seconds = add_projected_time(stages, throughput)
+    assert projected_seconds == pytest.approx(10.0)
+    assert stages["summarize"]["projected_seconds"] == pytest.approx(10.0)
+    assert stages["validation"]["projected_seconds"] is None
+    assert stages["validation"]["prompt_tokens"] is None
+
+def test_add_projected_time_fills_unknown_prompt_tokens():
+    stages = {"organize": {"calls": 2, "prompt_tokens": None}}
+    throughput = {"organize": {"seconds_per_call": 1.0, "prompt_tokens_per_call": 50.0}}
+    add_projected_time(stages, throughput)
+    assert stages["organize"]["prompt_tokens"] == 100
+
+def test_plan_platform_counts_items_and_calls():
+    processor = MockProcessor([
+        {"title": "title1", "url": "url1", "content": "word " * 500},
+        {"title": "title2", "url": "url2", "content": "short content"},
+        {"title": "title3", "url": "url3", "content": ""},
+    ])
+    platform_plan = plan_platform(processor, ["query1"], ["q1", "q2"], 30)
+    stages = platform_plan["stages"]
+    assert platform_plan["items_with_content"] == 2
+    assert platform_plan["items_without_content"] == 1
+    assert stages["summarize"]["calls"] == 4
+    assert stages["summarize"]["prompt_tokens"] == 502
+    assert stages["organize"]["calls"] == 1
+    assert stages["organize"]["prompt_tokens"] is None
+    assert stages["validation"]["calls"] == 8
+    assert stages["validation"]["prompt_tokens"] is None
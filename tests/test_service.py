@@ -0,0 +1,83 @@
+import logging
+import pytest
+import src.service as service_module
+from src.service import Job, ResearchService, validate_config, QUEUED, DONE, FAILED
+
+@pytest.fixture
+def config():
+    return {
+        "search_queries": ["query1"],
+        "specific_questions": ["question1"],
+        "platforms": ["youtube"],
+        "time_horizon": 30,
+        "max_outputs_per_platform": 3,
+    }
+
+@pytest.fixture
+def research_service(tmp_path):
+    return ResearchService(base_dir=str(tmp_path / "runs"))
+
+def test_validate_config_accepts_complete_config(config):
+    validate_config(config)
+
+def test_validate_config_rejects_missing_keys(config):
+    config.pop("platforms")
+    with pytest.raises(ValueError, match="platforms"):
+        validate_config(config)
+
+def test_validate_config_rejects_non_object():
+    with pytest.raises(ValueError):
+        validate_config(["not", "a", "config"])
+
+def test_job_lifecycle_to_dict(config):
+    job = Job(config)
+    assert job.to_dict()["status"] == QUEUED
+    job.update_progress("youtube", 0, 1)
+    job_dict = job.to_dict()
+    assert job_dict["id"] == job.id
+    assert job_dict["progress"] == {"platform": "youtube", "completed_platforms": 0, "total_platforms": 1}
+
+def test_submit_queues_job(research_service, config):
+    job = research_service.submit(config)
+    assert research_service.get_job(job.id) is job
+    assert research_service.queue.qsize() == 1
+
+def test_run_job_success(research_service, config, monkeypatch, caplog):
+    caplog.set_level(logging.INFO)
+    def fake_run_research(job_config, output_dir, processors=None, on_progress=None, task_queue=None):
+        on_progress("youtube", 0, 1)
+        logging.getLogger("src.test").info("Job log line")
+        return "run_name"
+    monkeypatch.setattr(service_module, "run_research", fake_run_research)
+    job = research_service.submit(config)
+    research_service.run_job(job)
+    assert job.status == DONE
+    assert job.run_name == "run_name"
+    assert job.finished_at is not None
+    with open(f"{job.output_dir}/app.log", "r") as file:
+        assert "Job log line" in file.read()
+
+def test_run_job_failure(research_service, config, monkeypatch):
+    def fake_run_research(*args, **kwargs):
+        raise RuntimeError("Platform unavailable")
+    monkeypatch.setattr(service_module, "run_research", fake_run_research)
+    job = research_service.submit(config)
+    research_service.run_job(job)
+    assert job.status == FAILED
+    assert job.error == "Platform unavailable"
+    assert job.finished_at is not None
+
+def test_run_job_failure_resets_processor_stats(research_service, config, monkeypatch):
+    class MockProcessor:
+        def __init__(self):
+            self.llm = type("MockLLM", (), {})()
+            self.llm.stats = {}
+
+    def fake_run_research(job_config, output_dir, processors=None, on_progress=None, task_queue=None):
+        processor = processors.setdefault("youtube", MockProcessor())
+        processor.llm.stats = {"summarize": {"calls": 1, "seconds": 1.0, "prompt_tokens": 10}}
+        raise RuntimeError("Platform unavailable")
+    monkeypatch.setattr(service_module, "run_research", fake_run_research)
+    job = research_service.submit(config)
+    research_service.run_job(job)
+    assert research_service.processors["youtube"].llm.stats == {}
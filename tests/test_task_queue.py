@@ -0,0 +1,96 @@
+import sqlite3
+import pytest
+from src.task_queue import TaskQueue, run_worker
+
+class MockLLM:
+    model_name = "mock_model"
+
+    def tag_content(self, content, questions):
+        if content == "broken":
+            raise RuntimeError("LLM backend unavailable")
+        return {"summary": f"Summary of {content}", "relevance_score": len(questions)}
+
+@pytest.fixture
+def task_queue(tmp_path):
+    return TaskQueue(str(tmp_path / "tasks.db"), max_attempts=2)
+
+def test_claim_returns_none_when_empty(task_queue):
+    assert task_queue.claim("worker1") is None
+
+def test_worker_processes_batch(task_queue):
+    batch_id = task_queue.enqueue_batch([
+        ("id1", {"content": "text1", "questions": ["q1"]}),
+        ("id2", {"content": "text2", "questions": ["q1", "q2"]}),
+    ])
+    run_worker(task_queue, MockLLM(), "worker1", stop_when_empty=True)
+    results, errors = task_queue.wait_for_batch(batch_id, poll_interval=0)
+    assert results["id1"] == {"summary": "Summary of text1", "relevance_score": 1}
+    assert results["id2"]["relevance_score"] == 2
+    assert errors == {}
+
+def test_failed_task_is_retried_then_reported(task_queue):
+    batch_id = task_queue.enqueue_batch([("id3", {"content": "broken", "questions": []})])
+    run_worker(task_queue, MockLLM(), "worker1", stop_when_empty=True)
+    results, errors = task_queue.wait_for_batch(batch_id, poll_interval=0)
+    assert results == {}
+    assert errors == {"id3": "LLM backend unavailable"}
+
+def test_expired_lease_is_reclaimed(task_queue):
+    task_queue.lease_seconds = -1
+    task_queue.enqueue_batch([("id4", {"content": "text4", "questions": []})])
+    first_task_id, _ = task_queue.claim("worker1")
+    second_task_id, _ = task_queue.claim("worker2")
+    assert first_task_id == second_task_id
+
+def test_expired_lease_fails_after_max_attempts(task_queue):
+    task_queue.lease_seconds = -1
+    batch_id = task_queue.enqueue_batch([("id5", {"content": "text5", "questions": []})])
+    assert task_queue.claim("worker1") is not None
+    assert task_queue.claim("worker2") is not None
+    assert task_queue.claim("worker3") is None
+    results, errors = task_queue.wait_for_batch(batch_id, poll_interval=0)
+    assert results == {}
+    assert "id5" in errors
+
+def test_wait_for_batch_times_out_without_workers(task_queue):
+    batch_id = task_queue.enqueue_batch([("id6", {"content": "text6", "questions": []})])
+    results, errors = task_queue.wait_for_batch(batch_id, poll_interval=0, timeout=0)
+    assert results == {}
+    assert errors == {"id6": "Timed out waiting for a worker"}
+
+def test_stale_worker_cannot_overwrite_result(task_queue):
+    task_queue.lease_seconds = -1
+    batch_id = task_queue.enqueue_batch([("id7", {"content": "text7", "questions": []})])
+    task_id, _ = task_queue.claim("worker1")
+    task_queue.claim("worker2")
+    assert task_queue.complete(task_id, "worker2", {"summary": "fresh"})
+    assert not task_queue.complete(task_id, "worker1", {"summary": "stale"})
+    assert not task_queue.fail(task_id, "worker1", "stale failure")
+    results, _ = task_queue.wait_for_batch(batch_id, poll_interval=0)
+    assert results == {"id7": {"summary": "fresh"}}
+
+def test_wait_for_batch_warns_when_no_worker_claims(task_queue, caplog):
+    batch_id = task_queue.enqueue_batch([("id8", {"content": "text8", "questions": []})])
+    task_queue.wait_for_batch(batch_id, poll_interval=0.01, timeout=0.1)
+    assert "No worker has claimed a task" in caplog.text
+
+def test_wait_for_batch_uses_queue_batch_timeout(tmp_path):
+    task_queue = TaskQueue(str(tmp_path / "tasks.db"), batch_timeout=0)
+    batch_id = task_queue.enqueue_batch([("id9", {"content": "text9", "questions": []})])
+    results, errors = task_queue.wait_for_batch(batch_id, poll_interval=0)
+    assert errors == {"id9": "Timed out waiting for a worker"}
+
+def test_worker_survives_queue_errors(task_queue, monkeypatch):
+    claim = task_queue.claim
+    calls = []
+
+    def flaky_claim(worker):
+        calls.append(worker)
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        return claim(worker)
+    monkeypatch.setattr(task_queue, "claim", flaky_claim)
+    batch_id = task_queue.enqueue_batch([("id10", {"content": "text10", "questions": []})])
+    run_worker(task_queue, MockLLM(), "worker1", poll_interval=0, stop_when_empty=True)
+    results, _ = task_queue.wait_for_batch(batch_id, poll_interval=0)
+    assert results["id10"]["summary"] == "Summary of text10"
@@ -0,0 +1,107 @@
+import pytest
+import src.processors.base_processor as base_processor
+import src.processors.youtube_processor as youtube_module
+from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled, TooManyRequests
+from src.data_storage import DataStorage, NO_CONTENT
+from src.processors.youtube_processor import YouTubeProcessor
+
+class MockTranscript:
+    def __init__(self, text):
+        self.text = text
+
+    def fetch(self):
+        return [{"text": part} for part in self.text.split()]
+
+class MockTranscriptList:
+    def __init__(self, manual=None, generated=None):
+        self.manual = manual
+        self.generated = generated
+
+    def find_manually_created_transcript(self, language_codes):
+        if self.manual is None:
+            raise NoTranscriptFound("video_id", language_codes, [])
+        return MockTranscript(self.manual)
+
+    def find_generated_transcript(self, language_codes):
+        if self.generated is None:
+            raise NoTranscriptFound("video_id", language_codes, [])
+        return MockTranscript(self.generated)
+
+@pytest.fixture
+def youtube_processor(monkeypatch):
+    monkeypatch.setattr(YouTubeProcessor, "authenticate_youtube", lambda self: None)
+    monkeypatch.setattr(base_processor.LLMFactory, "create_llm", staticmethod(lambda **kwargs: None))
+    monkeypatch.setattr(YouTubeProcessor, "TRANSCRIPT_RETRY_DELAY", 0)
+    return YouTubeProcessor()
+
+def mock_list_transcripts(monkeypatch, transcripts):
+    def list_transcripts(video_id):
+        transcript = transcripts[video_id]
+        if isinstance(transcript, Exception):
+            raise transcript
+        return transcript
+    monkeypatch.setattr(youtube_module.YouTubeTranscriptApi, "list_transcripts", list_transcripts)
+
+def test_manual_transcript_preferred(youtube_processor, monkeypatch):
+    mock_list_transcripts(monkeypatch, {"video1": MockTranscriptList(manual="manual text", generated="generated text")})
+    assert youtube_processor.fetch_detailed_content("video1") == "manual text"
+
+def test_generated_transcript_fallback(youtube_processor, monkeypatch):
+    mock_list_transcripts(monkeypatch, {"video1": MockTranscriptList(generated="generated text")})
+    assert youtube_processor.fetch_detailed_content("video1") == "generated text"
+
+def test_configured_transcript_languages(youtube_processor, monkeypatch):
+    requested = []
+
+    class RecordingTranscriptList(MockTranscriptList):
+        def find_manually_created_transcript(self, language_codes):
+            requested.append(language_codes)
+            return MockTranscript("text")
+    mock_list_transcripts(monkeypatch, {"video1": RecordingTranscriptList()})
+    youtube_processor.configure({"transcript_languages": ["pl", "en"]})
+    youtube_processor.fetch_detailed_content("video1")
+    youtube_processor.configure({})
+    youtube_processor.fetch_detailed_content("video1")
+    assert requested == [["pl", "en"], ["en"]]
+
+def test_missing_transcripts_go_to_no_content(youtube_processor, monkeypatch):
+    mock_list_transcripts(monkeypatch, {
+        "video1": MockTranscriptList(manual="first transcript"),
+        "video2": TranscriptsDisabled("video2"),
+        "video3": MockTranscriptList(manual=" "),
+        "video4": MockTranscriptList(generated="fourth transcript"),
+    })
+    sources = [("youtube", f"title{index}", f"url{index}", f"video{index}") for index in range(1, 5)]
+    items = youtube_processor.collect_source_details(sources)
+
+    assert [item["title"] for item in items] == ["title1", "title2", "title3", "title4"]
+    assert items[0]["content"] == "first transcript"
+    assert items[3]["content"] == "fourth transcript"
+    assert "content" not in items[1]
+    assert items[1]["missing_content"]["reason"] == "TranscriptsDisabled"
+    assert items[1]["missing_content"]["error"]
+    assert items[2]["missing_content"] == {"reason": "EmptyTranscript"}
+
+    data_storage = DataStorage()
+    data_storage.add_data_list("youtube", items)
+    _, data_without_content = youtube_processor.check_source_content(data_storage)
+    assert [record.title for record in data_without_content.records_for(status=NO_CONTENT)] == ["title2", "title3"]
+
+def test_transient_errors_are_retried(youtube_processor, monkeypatch):
+    attempts = []
+
+    def list_transcripts(video_id):
+        attempts.append(video_id)
+        if len(attempts) < 3:
+            raise TooManyRequests(video_id)
+        return MockTranscriptList(manual="transcript text")
+    monkeypatch.setattr(youtube_module.YouTubeTranscriptApi, "list_transcripts", list_transcripts)
+    assert youtube_processor.fetch_transcript("video1") == ("transcript text", None)
+    assert len(attempts) == 3
+
+def test_transient_errors_marked_missing_after_retries(youtube_processor, monkeypatch):
+    mock_list_transcripts(monkeypatch, {"video1": TooManyRequests("video1")})
+    transcript_text, missing_content = youtube_processor.fetch_transcript("video1")
+    assert transcript_text is None
+    assert missing_content["reason"] == "TooManyRequests"
+    assert "video1" in missing_content["error"]
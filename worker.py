@@ -0,0 +1,32 @@
+import argparse
+import logging
+import socket
+import os
+from src.llm.llm_factory import LLMFactory
+from src.task_queue import TaskQueue, run_worker, POLL_INTERVAL
+from src.utils import LOG_FORMAT
+
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Process tagging tasks from a shared task queue.")
+    parser.add_argument('--queue', required=True, help="Path to the SQLite task queue shared with the coordinator.")
+    parser.add_argument('--model-platform', default='ollama', help="LLM platform used by this worker.")
+    parser.add_argument('--model-name', default='llama3:instruct', help="LLM model used by this worker.")
+    parser.add_argument('--llm-host', default=None, help="LLM backend address, e.g. http://gpu-box:11434.")
+    parser.add_argument('--name', default=f"{socket.gethostname()}-{os.getpid()}", help="Worker name stored with claimed tasks.")
+    parser.add_argument('--poll-interval', type=float, default=POLL_INTERVAL, help="Seconds to wait when the queue is empty.")
+    parser.add_argument('--stop-when-empty', action='store_true', help="Exit once there are no tasks left.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    llm = LLMFactory.create_llm(model_type=args.model_platform, model_name=args.model_name, host=args.llm_host)
+    task_queue = TaskQueue(args.queue)
+    run_worker(task_queue, llm, args.name, poll_interval=args.poll_interval, stop_when_empty=args.stop_when_empty)
+
+if __name__ == "__main__":
+    main()